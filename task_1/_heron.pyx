@@ -0,0 +1,17 @@
+# cython: language_level=3
+"""
+Площади треугольников по формуле Герона, скомпилированные в C.
+"""
+
+cimport cython
+from libc.math cimport sqrt
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef void tri_areas(double[::1] a, double[::1] b, double[::1] c, double[::1] out) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef double s
+    for i in range(a.shape[0]):
+        s = 0.5 * (a[i] + b[i] + c[i])
+        out[i] = sqrt(s * (s - a[i]) * (s - b[i]) * (s - c[i]))
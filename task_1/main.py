@@ -1,41 +1,110 @@
 """
 Библиотека для вычисления площадей геометрических фигур.
 Содержит реализации Circle и Triangle с методами area и __str__,
-а также утилиту compute_area и набор юнит-тестов.
+утилиту compute_area, пакетную функцию compute_areas и набор юнит-тестов.
+
+compute_areas требует numpy; площади треугольников она считает C-расширением
+_heron (если собрано через setup.py), иначе ядром numba (если установлена),
+иначе выражением numpy.
 """
 
-from abc import ABC, abstractmethod
 import math
+import struct
+import sys
+from operator import attrgetter
+from typing import Callable, Protocol, runtime_checkable
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для пакетного compute_areas
+    np = None
+
+# Считать площадь Triangle через приближённый _fast_sqrt вместо math.sqrt.
+# Это только приближение (погрешность ~1e-3): в CPython оно не быстрее math.sqrt.
+# По умолчанию выключено; на compute_areas не влияет.
+FAST_SQRT = False
+
+try:
+    from _heron import tri_areas as _tri_areas
+except ImportError:  # C-расширение не собрано, см. setup.py
+    _tri_areas = None
+
+# Ядро Numba компилируется при первом вызове compute_areas, а не при импорте.
+_numba_loaded = False
+
+def _load_tri_areas():
+    """
+    Вернуть скомпилированное ядро площадей треугольников или None.
 
-class Figura(ABC):
+    Приоритет у C-расширения _heron; если его нет, ядро собирается через
+    numba (если она установлена). Без обоих compute_areas считает через numpy.
     """
-    Абстрактный класс для геометрических фигур.
+    global _tri_areas, _numba_loaded
+    if _tri_areas is None and not _numba_loaded:
+        _numba_loaded = True
+        # Ошибка компиляции, как и отсутствие numba, означает откат на numpy.
+        try:
+            from numba import njit, prange
+
+            @njit("void(f8[::1], f8[::1], f8[::1], f8[::1])", parallel=True, fastmath=True, cache=True)
+            def tri_areas(a, b, c, out):
+                for i in prange(a.shape[0]):
+                    s = 0.5 * (a[i] + b[i] + c[i])
+                    out[i] = math.sqrt(s * (s - a[i]) * (s - b[i]) * (s - c[i]))
+        except Exception:
+            return None
+
+        _tri_areas = tri_areas
+    return _tri_areas
+
+def _fast_sqrt(x: float) -> float:
+    """
+    Приближённый квадратный корень через быстрый обратный корень.
+
+    Начальное приближение 1/√x получается битовым трюком над float64,
+    затем уточняется одним шагом Ньютона; √x = x * (1/√x).
+    Относительная погрешность порядка 1e-3. Для нуля, субнормальных чисел
+    и бесконечности используется math.sqrt. В CPython медленнее math.sqrt.
+    """
+    if not sys.float_info.min <= x <= sys.float_info.max:
+        return math.sqrt(x)
+    i = struct.unpack("<q", struct.pack("<d", x))[0]
+    i = 0x5fe6eb50c7b537a9 - (i >> 1)
+    y = struct.unpack("<d", struct.pack("<q", i))[0]
+    return x * y * (1.5 - 0.5 * x * y * y)
+
+@runtime_checkable
+class Figura(Protocol):
+    """
+    Протокол геометрической фигуры: любой объект со свойством area.
     """
 
     @property
-    @abstractmethod
     def area(self) -> float:
         """
         Площадь фигуры.
         """
-        pass
+        ...
 
-    @abstractmethod
     def __str__(self) -> str:
         """
         Строковое представление фигуры.
         """
-        pass
+        ...
 
-class Circle(Figura):
+class Circle:
     """
     Класс для круга, задаётся радиусом.
     """
 
+    __slots__ = ("_radius", "_area", "_area_fn")
+
     def __init__(self, radius: int | float) -> None:
         if radius <= 0:
             raise ValueError("Радиус должен быть положительным.")
-        self._radius = radius 
+        self._radius = radius
+        self._area = math.pi * radius * radius
+        self._area_fn = None
 
     @property
     def radius(self) -> float:
@@ -46,31 +115,57 @@ class Circle(Figura):
         if value <= 0:
             raise ValueError("Радиус должен быть положительным.")
         self._radius = value
+        self._area = math.pi * value * value
+        self._area_fn = None
 
     @property
     def area(self) -> float:
         """
-        Площадь круга: π * r².
+        Площадь круга: π * r² (вычисляется при задании радиуса).
+        """
+        return self._area
+
+    @property
+    def area_fn(self) -> Callable[[], float]:
+        """
+        Функция без аргументов, возвращающая заранее посчитанную площадь.
+        Создаётся при первом обращении и пересоздаётся после смены радиуса.
+
+        Само обращение к area_fn — это свойство, поэтому c.area_fn() медленнее c.area.
+        Выигрыш есть только если вынести функцию из цикла: f = c.area_fn; f().
         """
-        return math.pi * (self._radius ** 2)
+        if self._area_fn is None:
+            self._area_fn = lambda area=self._area: area
+        return self._area_fn
+
+    def __reduce__(self) -> tuple[type["Circle"], tuple[int | float]]:
+        return (type(self), (self._radius,))
 
     def __str__(self) -> str:
         return f"Круг(радиус={self.radius}) → площадь={self.area:.2f}"
 
-class Triangle(Figura):
+class Triangle:
     """
     Класс для треугольника по длинам трёх сторон.
     Поддерживает вычисление площади по формуле Герона и проверку прямого угла.
     """
 
+    __slots__ = ("_a", "_b", "_c", "_area", "_max_side_sq", "_sum_sq")
+
     def __init__(self, a: int | float, b: int | float, c: int | float) -> None:
-        if any(side <= 0 for side in (a, b, c)):
+        if a <= 0 or b <= 0 or c <= 0:
             raise ValueError("Стороны треугольника должны быть положительными.")
         if (a + b <= c) or (a + c <= b) or (b + c <= a):
             raise ValueError("Нарушено неравенство треугольника.")
         self._a = a
         self._b = b
         self._c = c
+        s = 0.5 * (a + b + c)
+        sqrt = _fast_sqrt if FAST_SQRT else math.sqrt
+        self._area = sqrt(s * (s - a) * (s - b) * (s - c))
+        m = a if a >= b and a >= c else (b if b >= c else c)
+        self._max_side_sq = m * m
+        self._sum_sq = a * a + b * b + c * c
 
     @property
     def a(self) -> float:
@@ -87,17 +182,17 @@ class Triangle(Figura):
     @property
     def area(self) -> float:
         """
-        Площадь треугольника по формуле Герона.
+        Площадь треугольника по формуле Герона (вычисляется при создании).
         """
-        s = (self._a + self._b + self._c) / 2
-        return math.sqrt(s * (s - self._a) * (s - self._b) * (s - self._c))
+        return self._area
 
     def is_right(self) -> bool:
         """
         Проверить, является ли треугольник прямоугольным.
         """
-        sides = sorted((self._a, self._b, self._c))
-        return math.isclose(sides[0]**2 + sides[1]**2, sides[2]**2)
+        # a² + b² + c² = 2 * max² с относительной погрешностью 1e-9, как у math.isclose.
+        m2 = self._max_side_sq
+        return abs(self._sum_sq - m2 - m2) <= 1e-9 * m2
 
     def __str__(self) -> str:
         return f"Треугольник(стороны={self.a}, {self.b}, {self.c}) → площадь={self.area:.2f}"
@@ -111,27 +206,112 @@ def compute_area(shape: Figura) -> float:
 
     Returns:
         float: Площадь фигуры.
+
+    Для больших списков фигур быстрее обойтись без вызова функции на каждый
+    элемент: ``list(map(attrgetter("area"), shapes))``.
     """
     return shape.area
 
+def compute_areas(circles_r: "np.ndarray", tri_abc: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Пакетно вычислить площади кругов и треугольников.
+
+    Args:
+        circles_r (np.ndarray): массив радиусов формы (n,).
+        tri_abc (np.ndarray): массив сторон треугольников формы (m, 3).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: площади кругов и площади треугольников.
+
+    Raises:
+        ImportError: если не установлен numpy.
+        ValueError: если радиусы или стороны некорректны или tri_abc не формы (m, 3).
+    """
+    if np is None:
+        raise ImportError("Для compute_areas требуется numpy.")
+    circles_r = np.asarray(circles_r, dtype=np.float64)
+    tri_abc = np.asarray(tri_abc, dtype=np.float64)
+    if tri_abc.ndim != 2 or tri_abc.shape[1] != 3:
+        raise ValueError("Стороны треугольников должны быть массивом формы (m, 3).")
+
+    if not np.all(circles_r > 0):
+        raise ValueError("Радиус должен быть положительным.")
+    # Всегда копия: для одного треугольника .T уже C-непрерывен и остался бы read-only.
+    a, b, c = np.array(tri_abc.T, dtype=np.float64, order="C")
+    if not np.all((a > 0) & (b > 0) & (c > 0)):
+        raise ValueError("Стороны треугольника должны быть положительными.")
+    if not np.all((a + b > c) & (a + c > b) & (b + c > a)):
+        raise ValueError("Нарушено неравенство треугольника.")
+
+    circle_areas = np.pi * circles_r * circles_r
+    if (tri_areas := _load_tri_areas()) is not None:
+        triangle_areas = np.empty_like(a)
+        tri_areas(a, b, c, triangle_areas)
+    else:
+        s = 0.5 * (a + b + c)
+        triangle_areas = np.sqrt(s * (s - a) * (s - b) * (s - c))
+    return circle_areas, triangle_areas
+
 
 if __name__ == "__main__":
+    import copy
+    import pickle
     import unittest
+    from unittest import mock
 
     class TestShapes(unittest.TestCase):
         def test_circle_area(self):
             c = Circle(1)
             self.assertAlmostEqual(c.area, math.pi)
 
+        def test_circle_radius_setter_updates_area(self):
+            c = Circle(1)
+            c.radius = 2
+            self.assertAlmostEqual(c.area, 4 * math.pi)
+            self.assertEqual(c.area_fn(), c.area)
+
+        def test_circle_pickle(self):
+            c = Circle(3)
+            c.area_fn()
+            restored = pickle.loads(pickle.dumps(c))
+            self.assertEqual(restored.radius, 3)
+            self.assertEqual(restored.area_fn(), c.area)
+
+            class SubCircle(Circle):
+                __slots__ = ()
+
+            self.assertIs(type(copy.copy(SubCircle(1))), SubCircle)
+
         def test_triangle_area(self):
             t = Triangle(3, 4, 5)
             self.assertAlmostEqual(t.area, 6.0)
 
+        def test_triangle_fast_sqrt_flag(self):
+            with mock.patch(f"{__name__}.FAST_SQRT", True):
+                t = Triangle(3, 4, 5)
+            self.assertNotEqual(t.area, 6.0)
+            self.assertAlmostEqual(t.area, 6.0, delta=6.0 * 2e-3)
+            self.assertEqual(Triangle(3, 4, 5).area, 6.0)
+
+        def test_fast_sqrt_edge_cases(self):
+            self.assertEqual(_fast_sqrt(math.inf), math.inf)
+            self.assertEqual(_fast_sqrt(0.0), 0.0)
+            self.assertEqual(_fast_sqrt(5e-324), math.sqrt(5e-324))
+
         def test_triangle_right(self):
             t = Triangle(3, 4, 5)
             self.assertTrue(t.is_right())
             t2 = Triangle(2, 2, 3)
             self.assertFalse(t2.is_right())
+            self.assertTrue(Triangle(1, 1, math.sqrt(2)).is_right())
+
+        def test_shapes_have_no_dict(self):
+            self.assertFalse(hasattr(Circle(1), "__dict__"))
+            self.assertFalse(hasattr(Triangle(3, 4, 5), "__dict__"))
+
+        def test_shapes_match_protocol(self):
+            self.assertIsInstance(Circle(1), Figura)
+            self.assertIsInstance(Triangle(3, 4, 5), Figura)
 
         def test_invalid_circle(self):
             with self.assertRaises(ValueError):
@@ -143,7 +323,68 @@ if __name__ == "__main__":
 
         def test_dynamic_area(self):
             shapes = [Circle(2), Triangle(5, 5, 6)]
-            areas = [compute_area(s) for s in shapes]
+            areas = list(map(attrgetter("area"), shapes))
             self.assertEqual(len(areas), 2)
+            self.assertEqual(areas, [compute_area(s) for s in shapes])
+
+        @unittest.skipIf(np is None, "numpy не установлен")
+        def test_compute_areas(self):
+            circle_areas, triangle_areas = compute_areas(
+                np.array([1.0, 2.0]), np.array([[3.0, 4.0, 5.0], [5.0, 5.0, 6.0]])
+            )
+            self.assertTrue(np.allclose(circle_areas, [Circle(1).area, Circle(2).area]))
+            self.assertTrue(np.allclose(triangle_areas, [6.0, 12.0]))
+            with self.assertRaises(ValueError):
+                compute_areas(np.array([1.0]), np.array([[1.0, 2.0, 3.0]]))
+            with self.assertRaises(ValueError):
+                compute_areas(np.array([0.0]), np.array([[3.0, 4.0, 5.0]]))
+            with self.assertRaises(ValueError):
+                compute_areas(np.array([1.0]), np.array([3.0, 4.0, 5.0, 5.0, 5.0, 6.0]))
+            with self.assertRaises(ValueError):
+                compute_areas(np.array([1.0]), np.ones((2, 6)))
+
+        @unittest.skipIf(np is None, "numpy не установлен")
+        def test_compute_areas_backends_match(self):
+            rng = np.random.default_rng(0)
+            sides = rng.uniform(1.0, 2.0, size=(1000, 3))
+            radii = rng.uniform(0.5, 5.0, size=1000)
+            with mock.patch(f"{__name__}._load_tri_areas", return_value=None):
+                expected = compute_areas(radii, sides)[1]
+            self.assertTrue(np.allclose(expected, [Triangle(*abc).area for abc in sides]))
+            self.assertTrue(np.allclose(compute_areas(radii, sides)[1], expected))
+
+            tri_areas = _load_tri_areas()
+            if tri_areas is None:
+                self.skipTest("ни _heron, ни numba не доступны")
+            a, b, c = np.array(sides.T, order="C")
+            out = np.empty_like(a)
+            tri_areas(a, b, c, out)
+            self.assertTrue(np.allclose(out, expected))
+
+        @unittest.skipIf(np is None, "numpy не установлен")
+        def test_compute_areas_numba_compile_failure(self):
+            def broken_njit(*args, **kwargs):
+                raise RuntimeError("compile failed")
+
+            fake_numba = mock.Mock(njit=broken_njit, prange=range)
+            with mock.patch(f"{__name__}._tri_areas", None), \
+                    mock.patch(f"{__name__}._numba_loaded", False), \
+                    mock.patch.dict(sys.modules, {"numba": fake_numba}):
+                for _ in range(2):
+                    _, triangle_areas = compute_areas(np.array([1.0]), np.array([[3.0, 4.0, 5.0]]))
+                    self.assertTrue(np.allclose(triangle_areas, [6.0]))
+
+        @unittest.skipIf(np is None, "numpy не установлен")
+        def test_compute_areas_empty(self):
+            circle_areas, triangle_areas = compute_areas(np.empty(0), np.empty((0, 3)))
+            self.assertEqual(circle_areas.shape, (0,))
+            self.assertEqual(triangle_areas.shape, (0,))
+
+        @unittest.skipIf(np is None, "numpy не установлен")
+        def test_compute_areas_readonly_single_triangle(self):
+            tri_abc = np.array([[3.0, 4.0, 5.0]])
+            tri_abc.setflags(write=False)
+            _, triangle_areas = compute_areas(np.array([1.0]), tri_abc)
+            self.assertTrue(np.allclose(triangle_areas, [6.0]))
 
     unittest.main()
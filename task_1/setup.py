@@ -0,0 +1,16 @@
+"""
+Сборка C-расширения _heron: python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=cythonize(
+        Extension(
+            "_heron",
+            ["_heron.pyx"],
+            extra_compile_args=["-O3", "-march=native", "-ffast-math"],
+        )
+    ),
+)
@@ -1,7 +1,32 @@
 from pyspark.sql import SparkSession, DataFrame
-from pyspark.sql.functions import lit
+from pyspark.sql.functions import broadcast
+from pyspark.sql.types import IntegerType, StringType, StructField, StructType
 from pyspark.sql.utils import AnalysisException
 import logging
+import os
+
+PRODUCTS_SCHEMA = StructType([
+    StructField("product_id", IntegerType()),
+    StructField("product_name", StringType()),
+])
+CATEGORIES_SCHEMA = StructType([
+    StructField("category_id", IntegerType()),
+    StructField("category_name", StringType()),
+])
+PRODUCT_CATEGORIES_SCHEMA = StructType([
+    StructField("product_id", IntegerType()),
+    StructField("category_id", IntegerType()),
+])
+
+def read_table(spark: SparkSession, name: str, schema: StructType) -> DataFrame:
+    """
+    Прочитать таблицу с явной схемой: name.parquet, если он есть, иначе name.csv.
+
+    Явная схема избавляет от лишнего прохода по CSV, который делает inferSchema.
+    """
+    if os.path.exists(f"{name}.parquet"):
+        return spark.read.schema(schema).parquet(f"{name}.parquet")
+    return spark.read.csv(f"{name}.csv", header=True, schema=schema)
 
 class DfProductCategories:
     """
@@ -14,7 +39,9 @@ class DfProductCategories:
         df_product_categories: DataFrame
     ) -> DataFrame:
         """
-        Статический метод класса, который объединяет все пары "продукт-категория" с "продуктами" без категории(NULL) и возвращает их.
+        Статический метод класса, который возвращает все пары "продукт-категория" вместе с "продуктами" без категории(NULL).
+        Выполняется одним проходом из двух left join.
+        При многократном вызове на одних и тех же данных df_products стоит заранее закэшировать (.cache()).
 
         Args:
             df_products (DataFrame): таблица продуктов с колонками product_id, product_name.
@@ -31,18 +58,19 @@ class DfProductCategories:
             Exception: неожиданная ошибка.
         """
         try:
-            prod_cat_pairs = (
-                df_products
-                .join(other=df_product_categories, on="product_id", how="inner")
-                .join(other=categories, on="category_id", how="inner")
-                .select("product_name", "category_name")
-            )
+            # Лишние колонки отбрасываются до join, чтобы не гонять их через shuffle.
+            products = df_products.select("product_id", "product_name")
+            product_categories = df_product_categories.select("product_id", "category_id")
+            categories = df_categories.select("category_id", "category_name")
 
-            orphans = (
-                df_products
-                .join(other=df_product_categories, on="product_id", how="left_anti")
-                .select("product_name")
-                .withColumn("category_name", lit(None).cast("string"))
+            # Справочник категорий обычно мал (меньше spark.sql.autoBroadcastJoinThreshold,
+            # по умолчанию 10MB), поэтому он рассылается на все executor'ы
+            # и большая таблица связей не перемешивается ради этого join.
+            result = (
+                products
+                .join(other=product_categories, on="product_id", how="left")
+                .join(other=broadcast(categories), on="category_id", how="left")
+                .select("product_name", "category_name")
             )
         except AnalysisException as ae:
             logging.error(f"Ошибка аналитики Spark: {ae}")
@@ -55,15 +83,15 @@ class DfProductCategories:
             raise
 
         else:
-            return prod_cat_pairs.unionByName(orphans)
+            return result
 
 
 if __name__ == "__main__":
     spark = SparkSession.builder.appName("Products→Categories").getOrCreate()
 
-    products = spark.read.csv("products.csv",   header=True, inferSchema=True)
-    categories = spark.read.csv("categories.csv", header=True, inferSchema=True)
-    product_categories = spark.read.csv("product_categories.csv", header=True, inferSchema=True)
+    products = read_table(spark, "products", PRODUCTS_SCHEMA)
+    categories = read_table(spark, "categories", CATEGORIES_SCHEMA)
+    product_categories = read_table(spark, "product_categories", PRODUCT_CATEGORIES_SCHEMA)
 
     result_df = DfProductCategories.get_all_products_categories(
         df_products=products,